@@ -2,15 +2,16 @@
 from markdown_support import upload_markdown_file, render_markdown_content, integrate_with_brd_validation
 
 import streamlit as st
-import pandas as pd
+import concurrent.futures
+import hashlib
+import io
 import time
 from pathlib import Path
 
-# Import custom modules
+# Import custom modules. pandas, the parsers and ReportGenerator (which
+# pulls in plotly) are imported lazily inside the functions that use them
+# so the app's cold start doesn't pay for them up front.
 from utils.file_handlers import FileHandler
-from core.brd_parser import BRDParser
-from core.validation_engine import ValidationEngine
-from core.report_generator import ReportGenerator
 from config.settings import (
     APP_TITLE, APP_VERSION, APP_DESCRIPTION, 
     SEVERITY_LEVELS, MAX_ERRORS_DISPLAY
@@ -24,9 +25,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-def load_custom_css():
-    st.markdown("""
+# Custom CSS, hoisted to a module-level constant so the string is built once
+_CUSTOM_CSS = """
     <style>
     .main-header {
         font-size: 2.5rem;
@@ -49,7 +49,13 @@ def load_custom_css():
     .status-valid { color: #28a745; font-weight: bold; }
     .status-invalid { color: #dc3545; font-weight: bold; }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def load_custom_css():
+    """Inject the custom CSS once per session instead of on every rerun."""
+    if not st.session_state.get('_css_loaded'):
+        st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+        st.session_state._css_loaded = True
 
 def initialize_session_state():
     """Initialize session state variables."""
@@ -140,13 +146,25 @@ def process_uploaded_file(uploaded_file):
         st.sidebar.error(f"❌ {validation_result['error']}")
         return
     
-    # Display file info
+    # Display file info. Cache the derived metadata (suffix, formatted
+    # size) in session state so each rerun doesn't redo Path parsing and
+    # size formatting for the same upload.
     file_info = validation_result['file_info']
+    meta = st.session_state.get('file_meta')
+    if not meta or meta['name'] != file_info['name'] or meta['size'] != file_info['size']:
+        meta = {
+            'name': file_info['name'],
+            'size': file_info['size'],
+            'suffix': file_info['extension'],
+            'size_display': f"{file_info['size'] / 1024:.1f} KB"
+        }
+        st.session_state.file_meta = meta
+
     st.sidebar.success("✅ File uploaded successfully")
     st.sidebar.markdown(f"""
-    **File:** {file_info['name']}  
-    **Size:** {file_info['size'] / 1024:.1f} KB  
-    **Type:** {file_info['extension']}
+    **File:** {meta['name']}  
+    **Size:** {meta['size_display']}  
+    **Type:** {meta['suffix']}
     """)
     
     # Process file button
@@ -157,48 +175,110 @@ def process_uploaded_file(uploaded_file):
     if st.session_state.validation_results:
         show_validation_results()
 
+# Process pool for CPU-bound document extraction, created on first use so
+# idle sessions don't spawn workers
+_extraction_pool = None
+
+def _get_extraction_pool():
+    global _extraction_pool
+    if _extraction_pool is None:
+        _extraction_pool = concurrent.futures.ProcessPoolExecutor(max_workers=2)
+    return _extraction_pool
+
+def _extract_in_worker(temp_path: str, file_extension: str):
+    """Top-level extraction entry point so it is picklable for the pool."""
+    return FileHandler().extract_content(temp_path, file_extension)
+
+def _hash_uploaded_file(uploaded_file) -> str:
+    """Compute a blake2b content hash of the upload in streaming chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    uploaded_file.seek(0)
+    while chunk := uploaded_file.read(1024 * 1024):
+        digest.update(chunk)
+    uploaded_file.seek(0)
+    return digest.hexdigest()
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _parse_and_validate(content_hash: str, file_extension: str, _temp_path: str):
+    """Extract, parse and validate a document, cached by content hash.
+
+    The cache key is (content_hash, file_extension) so re-uploading the same
+    document skips the full extract/parse/validate pipeline; `_temp_path` is
+    excluded from hashing since temp file names vary between uploads.
+    """
+    from core.brd_parser import BRDParser
+    from core.validation_engine import ValidationEngine
+
+    # Offload PDF/DOCX extraction to a worker process so the Streamlit
+    # script thread (and other sessions) stay responsive during it
+    future = _get_extraction_pool().submit(_extract_in_worker, _temp_path, file_extension)
+    content = future.result()
+    if content['error']:
+        return {'error': content['error']}
+
+    parser = BRDParser()
+    is_structured = file_extension == '.json'
+    parse_result = parser.parse_document(content['text'], is_structured)
+
+    validator = ValidationEngine()
+    results, summary = validator.validate_document(parse_result)
+
+    return {
+        'error': None,
+        'parse_result': parse_result,
+        'results': results,
+        'summary': summary
+    }
+
 def process_document(uploaded_file, file_handler):
     """Process document and run validation."""
     try:
+        # Short-circuit: if this exact content was already validated in
+        # this session, the stored results are current — skip the temp
+        # file write and the whole pipeline.
+        content_hash = _hash_uploaded_file(uploaded_file)
+        if (st.session_state.get('last_content_hash') == content_hash
+                and st.session_state.validation_results):
+            st.info("ℹ️ Document unchanged — showing existing validation results.")
+            return
+
         # Save temporary file
         temp_path = file_handler.save_temp_file(uploaded_file)
         if not temp_path:
             st.error("Failed to save uploaded file")
             return
-        
+
         # Progress tracking
         progress_bar = st.progress(0)
         status_text = st.empty()
-        
+
         # Step 1: Extract content
         status_text.text("📄 Extracting document content...")
         progress_bar.progress(20)
-        
-        file_extension = Path(uploaded_file.name).suffix.lower()
-        content = file_handler.extract_content(temp_path, file_extension)
-        
-        if content['error']:
-            st.error(f"Content extraction failed: {content['error']}")
+
+        meta = st.session_state.get('file_meta')
+        file_extension = meta['suffix'] if meta else Path(uploaded_file.name).suffix.lower()
+
+        # Steps 2-3: Parse and validate (cached on content hash)
+        status_text.text("🔍 Parsing and validating document...")
+        progress_bar.progress(60)
+
+        outcome = _parse_and_validate(content_hash, file_extension, temp_path)
+
+        if outcome['error']:
+            st.error(f"Content extraction failed: {outcome['error']}")
             return
-        
-        # Step 2: Parse document
-        status_text.text("🔍 Parsing document structure...")
-        progress_bar.progress(40)
-        
-        parser = BRDParser()
-        is_structured = file_extension == '.json'
-        parse_result = parser.parse_document(content['text'], is_structured)
-        
+
+        parse_result = outcome['parse_result']
+        results = outcome['results']
+        summary = outcome['summary']
+
         if parse_result['parsing_errors']:
-            st.warning(f"Parsing warnings: {', '.join(parse_result['parsing_errors'][:3])}")
-        
-        # Step 3: Run validation
-        status_text.text("✅ Running validation rules...")
-        progress_bar.progress(60)
-        
-        validator = ValidationEngine()
-        results, summary = validator.validate_document(parse_result)
-        
+            # Dedupe (order-preserving) so repeated parser errors don't
+            # crowd out distinct warnings in the 3-message display window
+            unique_errors = list(dict.fromkeys(parse_result['parsing_errors']))
+            st.warning(f"Parsing warnings: {', '.join(unique_errors[:3])}")
+
         # Step 4: Generate report
         status_text.text("📊 Generating validation report...")
         progress_bar.progress(80)
@@ -207,21 +287,22 @@ def process_document(uploaded_file, file_handler):
         st.session_state.validation_results = results
         st.session_state.validation_summary = summary
         st.session_state.parsed_data = parse_result['parsed_data']
+        st.session_state.category_options = sorted({r.category for r in results})
+        st.session_state.last_content_hash = content_hash
         st.session_state.file_processed = True
         
         # Complete
         progress_bar.progress(100)
-        status_text.text("✅ Validation completed!")
-        time.sleep(1)
         progress_bar.empty()
         status_text.empty()
+        st.toast("Validation complete", icon="✅")
         
         # Cleanup
         file_handler.cleanup_temp_files()
-        
-        # Auto-rerun to show results
-        st.rerun()
-        
+
+        # Results are in session state, so process_uploaded_file renders
+        # them later in this same run; no st.rerun() round trip needed.
+
     except Exception as e:
         st.error(f"❌ Processing failed: {str(e)}")
         # Collect error log
@@ -242,8 +323,9 @@ def show_validation_results():
     
     if not results or not summary:
         return
-    
+
     # Generate report
+    from core.report_generator import ReportGenerator
     report_generator = ReportGenerator(results, summary)
     
     # Summary metrics
@@ -317,68 +399,97 @@ def show_overview_tab(report_generator, summary):
 
 def show_detailed_results_tab(results):
     """Show detailed results tab."""
+    import pandas as pd
+
     st.markdown("### 📋 All Validation Results")
     
-    # Create DataFrame
-    df_data = []
-    for result in results:
-        df_data.append({
-            'Rule ID': result.rule_id,
-            'Status': '✅ PASS' if result.passed else '❌ FAIL',
-            'Severity': f"{SEVERITY_LEVELS[result.severity]['icon']} {result.severity}",
-            'Category': result.category,
-            'Description': result.rule_description,
-            'Details': result.details[:100] + "..." if len(result.details) > 100 else result.details
-        })
-    
-    df = pd.DataFrame(df_data)
-    
+    # Create DataFrame from the columnar (structure-of-arrays) layout
+    # instead of a per-row list of dicts, which pandas has to re-pivot
+    # into columns. Status/Severity/Category are stored as raw
+    # categoricals so filtering is a C-level equality check; icons are
+    # added only at render time.
+    import numpy as np
+    from core.validation_engine import results_to_columns
+
+    cols = results_to_columns(results)
+
+    # Truncate details with vectorized string ops rather than a per-row
+    # Python len()/slice loop
+    details = pd.Series(cols['details'])
+    details = details.str.slice(0, 100).where(details.str.len() <= 100,
+                                              details.str.slice(0, 100) + "...")
+
+    df = pd.DataFrame({
+        'Rule ID': cols['rule_id'],
+        'Status': pd.Categorical(np.where(cols['passed'], 'PASS', 'FAIL')),
+        'Severity': pd.Categorical(cols['severity']),
+        'Category': pd.Categorical(cols['category']),
+        'Description': cols['description'],
+        'Details': details
+    })
+
     # Filter options
     col1, col2, col3 = st.columns(3)
-    
+
     with col1:
         status_filter = st.selectbox("Filter by Status", ["All", "PASS", "FAIL"])
     with col2:
         severity_filter = st.selectbox("Filter by Severity", ["All", "Critical", "High", "Medium", "Low"])
     with col3:
-        category_filter = st.selectbox("Filter by Category", ["All"] + df['Category'].unique().tolist())
-    
-    # Apply filters
-    filtered_df = df.copy()
+        # Category options are computed once at validation time; deriving
+        # them from the DataFrame would rescan the column on every rerun
+        category_options = st.session_state.get('category_options') or df['Category'].unique().tolist()
+        category_filter = st.selectbox("Filter by Category", ["All"] + category_options)
+
+    # Apply filters as one combined boolean mask
+    mask = pd.Series(True, index=df.index)
     if status_filter != "All":
-        filtered_df = filtered_df[filtered_df['Status'].str.contains(status_filter)]
+        mask &= df['Status'].eq(status_filter)
     if severity_filter != "All":
-        filtered_df = filtered_df[filtered_df['Severity'].str.contains(severity_filter)]
+        mask &= df['Severity'].eq(severity_filter)
     if category_filter != "All":
-        filtered_df = filtered_df[filtered_df['Category'] == category_filter]
-    
+        mask &= df['Category'].eq(category_filter)
+    filtered_df = df[mask]
+
+    # Add display icons on the filtered rows only
+    display_df = filtered_df.assign(
+        Status=filtered_df['Status'].map(lambda s: '✅ PASS' if s == 'PASS' else '❌ FAIL'),
+        Severity=filtered_df['Severity'].map(lambda s: f"{SEVERITY_LEVELS[s]['icon']} {s}")
+    )
+
     # Display table
-    st.dataframe(filtered_df, use_container_width=True, height=400)
+    st.dataframe(display_df, use_container_width=True, height=400)
 
 def show_failed_rules_tab(results):
     """Show failed rules tab."""
-    failed_results = [r for r in results if not r.passed]
-    
-    if not failed_results:
+    # Bucket failures by severity in a single pass over the results
+    failure_buckets = {'Critical': [], 'High': [], 'Medium': [], 'Low': []}
+    failed_count = 0
+    for r in results:
+        if not r.passed:
+            failure_buckets[r.severity].append(r)
+            failed_count += 1
+
+    if not failed_count:
         st.success("🎉 No failed validations! Your document passes all rules.")
         return
-    
-    st.markdown(f"### ❌ Failed Validations ({len(failed_results)} rules)")
-    
-    # Group by severity
+
+    st.markdown(f"### ❌ Failed Validations ({failed_count} rules)")
+
     for severity in ['Critical', 'High', 'Medium', 'Low']:
-        severity_failures = [r for r in failed_results if r.severity == severity]
+        severity_failures = failure_buckets[severity]
         if severity_failures:
-            with st.expander(f"{SEVERITY_LEVELS[severity]['icon']} {severity} Issues ({len(severity_failures)})", 
+            with st.expander(f"{SEVERITY_LEVELS[severity]['icon']} {severity} Issues ({len(severity_failures)})",
                            expanded=(severity == 'Critical')):
-                for result in severity_failures:
-                    st.markdown(f"""
-                    **{result.rule_id}:** {result.rule_description}
-                    
-                    *Category:* {result.category}  
-                    *Details:* {result.details}
-                    """)
-                    st.divider()
+                # One st.markdown per bucket instead of a markdown+divider
+                # pair per rule (two frontend messages per failure)
+                body = "\n\n---\n\n".join(
+                    f"**{result.rule_id}:** {result.rule_description}\n\n"
+                    f"*Category:* {result.category}  \n"
+                    f"*Details:* {result.details}"
+                    for result in severity_failures
+                )
+                st.markdown(body)
 
 def show_analytics_tab(report_generator):
     """Show analytics tab."""
@@ -420,12 +531,16 @@ def show_report_tab(report_generator):
         )
     
     with col2:
-        # Download results CSV
+        # Download results CSV. Write into a bytes buffer (chunked for large
+        # result sets) and hand bytes to Streamlit, which skips the utf-8
+        # re-encode it performs on str payloads.
         df = report_generator.generate_results_dataframe()
-        csv = df.to_csv(index=False)
+        buf = io.BytesIO()
+        df.to_csv(buf, index=False, encoding='utf-8',
+                  chunksize=1000 if len(df) > 10000 else None)
         st.download_button(
             label="📊 Download Results CSV",
-            data=csv,
+            data=buf.getvalue(),
             file_name=f"brd_validation_results_{int(time.time())}.csv",
             mime="text/csv"
         )
@@ -1,12 +1,17 @@
 """Validation rules configuration and definitions."""
 
+import re
 from typing import Dict, List, Any, Callable
 from config.settings import SEVERITY_LEVELS
+from utils.helpers import extract_percentages, validate_percentage_sum
 
 class ValidationRule:
     """Individual validation rule definition."""
-    
-    def __init__(self, rule_id: str, description: str, severity: str, 
+
+    __slots__ = ('rule_id', 'description', 'severity', 'validation_func',
+                 'category', 'priority')
+
+    def __init__(self, rule_id: str, description: str, severity: str,
                  validation_func: Callable, category: str):
         self.rule_id = rule_id
         self.description = description
@@ -80,24 +85,29 @@ VALIDATION_RULES = {
     # Add more validation rules here following the same pattern...
 }
 
+VALID_USER_INTENT_CATEGORIES = [
+    'new build', 'modernization', 'AI-enablement',
+    'integration', 'UX reimagining', 'domain-specific'
+]
+
+# Single compiled alternation so category matching is one C-level scan of
+# the content instead of one Python substring search per category.
+_INTENT_CATEGORY_PATTERN = re.compile(
+    '|'.join(re.escape(category) for category in VALID_USER_INTENT_CATEGORIES),
+    re.IGNORECASE
+)
+
 def _validate_user_intent_category(data: Dict[str, Any]) -> bool:
     """Validate user intent category values."""
-    valid_categories = [
-        'new build', 'modernization', 'AI-enablement', 
-        'integration', 'UX reimagining', 'domain-specific'
-    ]
-    
     node_01 = data['parsed_data']['nodes'].get('0.1')
     if not node_01 or not node_01['present']:
         return False
-    
-    content = node_01['content'].lower() if node_01['content'] else ''
-    return any(category in content for category in valid_categories)
+
+    content = node_01['content'] if node_01['content'] else ''
+    return _INTENT_CATEGORY_PATTERN.search(content) is not None
 
 def _validate_percentage_sum(data: Dict[str, Any], node_id: str) -> bool:
     """Validate that percentages in a node sum to 100%."""
-    from utils.helpers import extract_percentages, validate_percentage_sum
-    
     node = data['parsed_data']['nodes'].get(node_id)
     if not node or not node['present']:
         return False
@@ -110,20 +120,74 @@ def _validate_percentage_sum(data: Dict[str, Any], node_id: str) -> bool:
     
     return validate_percentage_sum(percentages)
 
+# Per-rule expressions used by the fused runner below. Each expression is
+# evaluated against the shared aggregates computed once per document
+# (present_sections, present_nodes, ...) instead of re-walking the parsed
+# data inside every rule's lambda. Rules without an entry fall back to
+# their validation_func.
+_RULE_EXPRS = {
+    'V001': "present_sections >= 5",
+    'V002': "present_nodes == total_nodes",
+    'V006': "present_nodes >= 18",
+    'V013': "len(content_analysis['nodes_with_placeholders']) == 0",
+    'V014': "content_analysis['total_word_count'] >= 1000",
+    'V015': "_validate_user_intent_category(data)",
+    'V020': "_validate_percentage_sum(data, '0.2')",
+}
+
+def compile_rules() -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Compile all validation rules into a single fused function.
+
+    Generates Python source that computes shared aggregates over the parsed
+    document once and then evaluates every rule expression, so the
+    validation pass walks the nodes/sections dicts a single time instead of
+    once per rule. Returns a callable mapping parsed data to
+    ``{rule_id: (passed, error_or_None)}``.
+    """
+    lines = [
+        "def _run(data):",
+        "    parsed = data['parsed_data']",
+        "    sections = parsed['sections']",
+        "    nodes = parsed['nodes']",
+        "    content_analysis = parsed.get('content_analysis', {})",
+        "    present_sections = sum(1 for s in sections.values() if s['present'])",
+        "    present_nodes = sum(1 for n in nodes.values() if n['present'])",
+        "    total_nodes = len(nodes)",
+        "    results = {}",
+    ]
+    for rule_id in VALIDATION_RULES:
+        expr = _RULE_EXPRS.get(rule_id, f"_FUNCS[{rule_id!r}](data)")
+        lines.append("    try:")
+        lines.append(f"        results[{rule_id!r}] = (bool({expr}), None)")
+        lines.append("    except Exception as e:")
+        lines.append(f"        results[{rule_id!r}] = (False, str(e))")
+    lines.append("    return results")
+
+    namespace = {
+        '_validate_user_intent_category': _validate_user_intent_category,
+        '_validate_percentage_sum': _validate_percentage_sum,
+        '_FUNCS': {rule_id: rule.validation_func for rule_id, rule in VALIDATION_RULES.items()},
+    }
+    exec('\n'.join(lines), namespace)
+    return namespace['_run']
+
+# Fused runner compiled once at import; ValidationEngine uses this instead
+# of iterating per-rule lambdas.
+COMPILED_RULE_RUNNER = compile_rules()
+
+# The rule table is immutable at runtime, so group it once at import
+# instead of rebuilding these dicts on every Streamlit rerun.
+RULES_BY_CATEGORY: Dict[str, List[ValidationRule]] = {}
+RULES_BY_SEVERITY: Dict[str, List[ValidationRule]] = {}
+for _rule in VALIDATION_RULES.values():
+    RULES_BY_CATEGORY.setdefault(_rule.category, []).append(_rule)
+    RULES_BY_SEVERITY.setdefault(_rule.severity, []).append(_rule)
+del _rule
+
 def get_validation_rules_by_category() -> Dict[str, List[ValidationRule]]:
     """Group validation rules by category."""
-    categories = {}
-    for rule in VALIDATION_RULES.values():
-        if rule.category not in categories:
-            categories[rule.category] = []
-        categories[rule.category].append(rule)
-    return categories
+    return RULES_BY_CATEGORY
 
 def get_validation_rules_by_severity() -> Dict[str, List[ValidationRule]]:
     """Group validation rules by severity."""
-    severities = {}
-    for rule in VALIDATION_RULES.values():
-        if rule.severity not in severities:
-            severities[rule.severity] = []
-        severities[rule.severity].append(rule)
-    return severities
\ No newline at end of file
+    return RULES_BY_SEVERITY
\ No newline at end of file
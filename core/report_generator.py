@@ -1,20 +1,49 @@
 """Generate validation reports and visualizations."""
 
+import numpy as np
 import pandas as pd
+from collections import defaultdict
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from typing import List, Dict, Any
-from core.validation_engine import ValidationResult, ValidationSummary
+from core.validation_engine import ValidationResult, ValidationSummary, results_to_columns
 from config.settings import SEVERITY_LEVELS
 from utils.helpers import get_current_timestamp
 
 class ReportGenerator:
     """Generate comprehensive validation reports."""
     
+    SEVERITY_ORDER = ['Critical', 'High', 'Medium', 'Low']
+
     def __init__(self, results: List[ValidationResult], summary: ValidationSummary):
         self.results = results
         self.summary = summary
+        # Columnar view built once; every chart/table aggregation below
+        # runs as a pandas groupby over these columns instead of a Python
+        # loop over result objects
+        cols = results_to_columns(results)
+        self._df = pd.DataFrame({
+            'rule_id': cols['rule_id'],
+            'description': cols['description'],
+            'category': pd.Categorical(cols['category']),
+            'severity': pd.Categorical(cols['severity'], categories=self.SEVERITY_ORDER),
+            'passed': cols['passed'],
+            'details': cols['details'],
+            'execution_time': [r.execution_time for r in results]
+        })
+        # Figures memoized per generator instance; Streamlit re-renders
+        # rebuild charts from the same results otherwise
+        self._chart_cache = {}
+
+    def _pass_fail_counts(self, column: str) -> pd.DataFrame:
+        """Count passed/failed results grouped by the given column."""
+        counts = (self._df.groupby([column, 'passed'], observed=True)
+                  .size().unstack(fill_value=0))
+        for outcome in (True, False):
+            if outcome not in counts.columns:
+                counts[outcome] = 0
+        return counts
     
     def generate_summary_metrics(self) -> Dict[str, Any]:
         """Generate key summary metrics."""
@@ -29,6 +58,9 @@ class ReportGenerator:
     
     def create_summary_chart(self) -> go.Figure:
         """Create summary visualization chart."""
+        if 'summary' in self._chart_cache:
+            return self._chart_cache['summary']
+
         # Create pie chart for validation results
         labels = ['Passed', 'Critical', 'High', 'Medium', 'Low']
         values = [
@@ -49,29 +81,27 @@ class ReportGenerator:
         
         fig.update_layout(
             title="Validation Results Overview",
-            annotations=[dict(text=f'{self.summary.overall_score:.1f}%<br>Score', 
+            annotations=[dict(text=f'{self.summary.overall_score:.1f}%<br>Score',
                             x=0.5, y=0.5, font_size=20, showarrow=False)]
         )
-        
+
+        self._chart_cache['summary'] = fig
         return fig
-    
+
     def create_severity_breakdown_chart(self) -> go.Figure:
         """Create severity breakdown chart."""
-        severity_data = {
-            'Critical': {'passed': 0, 'failed': self.summary.critical_failures},
-            'High': {'passed': 0, 'failed': self.summary.high_failures},
-            'Medium': {'passed': 0, 'failed': self.summary.medium_failures},
-            'Low': {'passed': 0, 'failed': self.summary.low_failures}
-        }
-        
-        # Calculate passed for each severity
-        for result in self.results:
-            if result.passed:
-                severity_data[result.severity]['passed'] += 1
-        
-        severities = list(severity_data.keys())
-        passed_counts = [severity_data[s]['passed'] for s in severities]
-        failed_counts = [severity_data[s]['failed'] for s in severities]
+        if 'severity' in self._chart_cache:
+            return self._chart_cache['severity']
+
+        # The categorical's integer codes follow SEVERITY_ORDER, so the
+        # pass/fail tally is two branchless bincounts over small ints
+        # rather than string-keyed grouping
+        codes = self._df['severity'].cat.codes.to_numpy()
+        passed_mask = self._df['passed'].to_numpy()
+
+        severities = self.SEVERITY_ORDER
+        passed_counts = np.bincount(codes[passed_mask], minlength=4).tolist()
+        failed_counts = np.bincount(codes[~passed_mask], minlength=4).tolist()
         
         fig = go.Figure(data=[
             go.Bar(name='Passed', x=severities, y=passed_counts, marker_color='#28a745'),
@@ -84,25 +114,20 @@ class ReportGenerator:
             yaxis_title='Number of Rules',
             barmode='stack'
         )
-        
+
+        self._chart_cache['severity'] = fig
         return fig
-    
+
     def create_category_breakdown_chart(self) -> go.Figure:
         """Create category breakdown chart."""
-        category_data = {}
-        
-        for result in self.results:
-            if result.category not in category_data:
-                category_data[result.category] = {'passed': 0, 'failed': 0}
-            
-            if result.passed:
-                category_data[result.category]['passed'] += 1
-            else:
-                category_data[result.category]['failed'] += 1
-        
-        categories = list(category_data.keys())
-        passed_counts = [category_data[c]['passed'] for c in categories]
-        failed_counts = [category_data[c]['failed'] for c in categories]
+        if 'category' in self._chart_cache:
+            return self._chart_cache['category']
+
+        counts = self._pass_fail_counts('category')
+
+        categories = counts.index.tolist()
+        passed_counts = counts[True].tolist()
+        failed_counts = counts[False].tolist()
         
         fig = go.Figure(data=[
             go.Bar(name='Passed', x=categories, y=passed_counts, marker_color='#28a745'),
@@ -116,30 +141,36 @@ class ReportGenerator:
             barmode='stack',
             xaxis_tickangle=-45
         )
-        
+
+        self._chart_cache['category'] = fig
         return fig
     
     def generate_results_dataframe(self) -> pd.DataFrame:
         """Convert results to pandas DataFrame."""
-        data = []
-        for result in self.results:
-            data.append({
-                'Rule ID': result.rule_id,
-                'Description': result.rule_description,
-                'Category': result.category,
-                'Severity': result.severity,
-                'Status': 'PASS' if result.passed else 'FAIL',
-                'Details': result.details,
-                'Execution Time (ms)': round(result.execution_time * 1000, 2)
-            })
-        
-        return pd.DataFrame(data)
+        return pd.DataFrame({
+            'Rule ID': self._df['rule_id'],
+            'Description': self._df['description'],
+            'Category': self._df['category'],
+            'Severity': self._df['severity'],
+            'Status': np.where(self._df['passed'], 'PASS', 'FAIL'),
+            'Details': self._df['details'],
+            'Execution Time (ms)': (self._df['execution_time'] * 1000).round(2)
+        })
     
     def generate_executive_summary(self) -> str:
         """Generate executive summary text."""
         status = "VALID" if self.summary.critical_failures == 0 else "INVALID"
-        
-        summary_text = f"""
+
+        if self.summary.critical_failures > 0:
+            recommendation = f"❌ **Document requires immediate attention.** {self.summary.critical_failures} critical issues must be resolved before proceeding."
+        elif self.summary.high_failures > 0:
+            recommendation = f"⚠️ **Document needs improvements.** Address {self.summary.high_failures} high-priority issues before implementation."
+        elif self.summary.medium_failures > 0:
+            recommendation = f"✅ **Document is acceptable with minor improvements.** Consider addressing {self.summary.medium_failures} medium-priority issues."
+        else:
+            recommendation = "✅ **Document meets all validation criteria and is ready for implementation.**"
+
+        return f"""
 # BRD Validation Executive Summary
 
 **Document Status:** {status}
@@ -158,39 +189,33 @@ class ReportGenerator:
 - **Low Priority Issues:** {self.summary.low_failures} (Nice to have)
 
 ## Recommendation
-"""
-        
-        if self.summary.critical_failures > 0:
-            summary_text += f"❌ **Document requires immediate attention.** {self.summary.critical_failures} critical issues must be resolved before proceeding."
-        elif self.summary.high_failures > 0:
-            summary_text += f"⚠️ **Document needs improvements.** Address {self.summary.high_failures} high-priority issues before implementation."
-        elif self.summary.medium_failures > 0:
-            summary_text += f"✅ **Document is acceptable with minor improvements.** Consider addressing {self.summary.medium_failures} medium-priority issues."
-        else:
-            summary_text += "✅ **Document meets all validation criteria and is ready for implementation.**"
-        
-        return summary_text
-    
+{recommendation}"""
+
     def generate_detailed_report(self) -> str:
         """Generate detailed validation report."""
-        report = self.generate_executive_summary()
-        
-        # Add failed validations details
-        failed_results = [r for r in self.results if not r.passed]
-        if failed_results:
-            report += "\n\n## Failed Validations\n\n"
-            
-            # Group by severity
-            for severity in ['Critical', 'High', 'Medium', 'Low']:
-                severity_failures = [r for r in failed_results if r.severity == severity]
+        # Assemble the report as a list of parts joined once at the end;
+        # repeated += on a growing string recopies the whole buffer
+        parts = [self.generate_executive_summary()]
+
+        # Group failed validations by severity in one pass
+        failure_buckets = defaultdict(list)
+        for r in self.results:
+            if not r.passed:
+                failure_buckets[r.severity].append(r)
+
+        if failure_buckets:
+            parts.append("\n\n## Failed Validations\n\n")
+
+            for severity in self.SEVERITY_ORDER:
+                severity_failures = failure_buckets[severity]
                 if severity_failures:
                     icon = SEVERITY_LEVELS[severity]['icon']
-                    report += f"\n### {icon} {severity} Issues\n\n"
-                    
+                    parts.append(f"\n### {icon} {severity} Issues\n\n")
+
                     for result in severity_failures:
-                        report += f"**{result.rule_id}:** {result.rule_description}\n"
+                        parts.append(f"**{result.rule_id}:** {result.rule_description}\n")
                         if result.details:
-                            report += f"*Details:* {result.details}\n"
-                        report += "\n"
-        
-        return report
\ No newline at end of file
+                            parts.append(f"*Details:* {result.details}\n")
+                        parts.append("\n")
+
+        return "".join(parts)
\ No newline at end of file
@@ -1,13 +1,15 @@
 """Core validation engine for BRD documents."""
 
 import time
+import numpy as np
+from collections import Counter
 from typing import Dict, List, Any, Tuple
 from dataclasses import dataclass
-from config.validation_rules import VALIDATION_RULES, ValidationRule
+from config.validation_rules import VALIDATION_RULES, ValidationRule, COMPILED_RULE_RUNNER
 from config.settings import VALIDATION_TIMEOUT
 from utils.helpers import get_current_timestamp, format_validation_message
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Individual validation result."""
     rule_id: str
@@ -19,7 +21,7 @@ class ValidationResult:
     details: str = ""
     execution_time: float = 0.0
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationSummary:
     """Overall validation summary."""
     total_rules: int
@@ -33,6 +35,23 @@ class ValidationSummary:
     execution_time: float
     timestamp: str
 
+def results_to_columns(results: List[ValidationResult]) -> Dict[str, np.ndarray]:
+    """Convert validation results to a columnar (structure-of-arrays) layout.
+
+    Rendering and aggregation code can then operate on whole NumPy columns
+    (boolean masks, np.where) instead of touching each result object's
+    attributes row by row.
+    """
+    count = len(results)
+    return {
+        'rule_id': np.array([r.rule_id for r in results], dtype=object),
+        'passed': np.fromiter((r.passed for r in results), dtype=bool, count=count),
+        'severity': np.array([r.severity for r in results], dtype=object),
+        'category': np.array([r.category for r in results], dtype=object),
+        'description': np.array([r.rule_description for r in results], dtype=object),
+        'details': np.array([r.details for r in results], dtype=object)
+    }
+
 class ValidationEngine:
     """Main validation engine for BRD documents."""
     
@@ -40,21 +59,36 @@ class ValidationEngine:
         self.results: List[ValidationResult] = []
         self.summary: ValidationSummary = None
         self.validation_start_time = None
+        self._severity_groups = None
+        self._category_groups = None
+        self._failed_results = None
     
     def validate_document(self, parsed_data: Dict[str, Any]) -> Tuple[List[ValidationResult], ValidationSummary]:
         """Run all validation rules against parsed document data."""
         self.validation_start_time = time.time()
         self.results = []
+        self._severity_groups = None
+        self._category_groups = None
+        self._failed_results = None
         
         print(f"Starting validation with {len(VALIDATION_RULES)} rules...")
-        
-        # Run each validation rule
+
+        # Run all rules in one fused pass over the parsed data. Rules are
+        # pure functions of parsed_data and would be trivially parallel,
+        # but a thread pool was measured as a loss here: the fused runner
+        # already amortizes the data walk across all rules, and the
+        # remaining per-rule work is far below thread dispatch overhead
+        # (and GIL-bound dict traversal besides).
+        rule_outcomes = COMPILED_RULE_RUNNER(parsed_data)
+
+        deadline = self.validation_start_time + VALIDATION_TIMEOUT
         for rule_id, rule in VALIDATION_RULES.items():
-            if time.time() - self.validation_start_time > VALIDATION_TIMEOUT:
+            if time.time() > deadline:
                 print(f"Validation timeout reached after {VALIDATION_TIMEOUT} seconds")
                 break
-            
-            result = self._execute_validation_rule(rule, parsed_data)
+
+            passed, error = rule_outcomes[rule_id]
+            result = self._build_validation_result(rule, parsed_data, passed, error)
             self.results.append(result)
         
         # Generate summary
@@ -63,23 +97,21 @@ class ValidationEngine:
         print(f"Validation completed in {self.summary.execution_time:.2f} seconds")
         return self.results, self.summary
     
-    def _execute_validation_rule(self, rule: ValidationRule, data: Dict[str, Any]) -> ValidationResult:
-        """Execute a single validation rule."""
+    def _build_validation_result(self, rule: ValidationRule, data: Dict[str, Any],
+                                 passed: bool, error: str = None) -> ValidationResult:
+        """Build a ValidationResult from a fused-runner outcome."""
         start_time = time.time()
-        
-        try:
-            # Execute the validation function
-            passed = rule.validation_func(data)
-            message = f"Rule {rule.rule_id} {'PASSED' if passed else 'FAILED'}"
-            details = self._get_rule_details(rule, data, passed)
-            
-        except Exception as e:
+
+        if error is not None:
             passed = False
             message = f"Rule {rule.rule_id} FAILED - Execution Error"
-            details = f"Error executing validation: {str(e)}"
-        
+            details = f"Error executing validation: {error}"
+        else:
+            message = f"Rule {rule.rule_id} {'PASSED' if passed else 'FAILED'}"
+            details = self._get_rule_details(rule, data, passed)
+
         execution_time = time.time() - start_time
-        
+
         return ValidationResult(
             rule_id=rule.rule_id,
             rule_description=rule.description,
@@ -134,19 +166,41 @@ class ValidationEngine:
     def _generate_summary(self) -> ValidationSummary:
         """Generate validation summary statistics."""
         total_rules = len(self.results)
-        passed = len([r for r in self.results if r.passed])
-        failed = total_rules - passed
-        
-        # Count failures by severity
-        critical_failures = len([r for r in self.results if not r.passed and r.severity == 'Critical'])
-        high_failures = len([r for r in self.results if not r.passed and r.severity == 'High'])
-        medium_failures = len([r for r in self.results if not r.passed and r.severity == 'Medium'])
-        low_failures = len([r for r in self.results if not r.passed and r.severity == 'Low'])
-        
-        # Calculate overall score (weighted by severity)
+
+        # Tally pass count, per-severity failure counts, the weighted
+        # score and the derived groupings in a single pass over the
+        # results; the get_results_by_* / get_failed_results accessors
+        # reuse the cached groupings.
         severity_weights = {'Critical': 4, 'High': 3, 'Medium': 2, 'Low': 1}
-        total_possible_score = sum(severity_weights[r.severity] for r in self.results)
-        actual_score = sum(severity_weights[r.severity] for r in self.results if r.passed)
+        failure_counts = Counter()
+        severity_groups = {'Critical': [], 'High': [], 'Medium': [], 'Low': []}
+        category_groups = {}
+        failed_results = []
+        passed = 0
+        total_possible_score = 0
+        actual_score = 0
+
+        for result in self.results:
+            weight = severity_weights[result.severity]
+            total_possible_score += weight
+            severity_groups[result.severity].append(result)
+            category_groups.setdefault(result.category, []).append(result)
+            if result.passed:
+                passed += 1
+                actual_score += weight
+            else:
+                failure_counts[result.severity] += 1
+                failed_results.append(result)
+
+        self._severity_groups = severity_groups
+        self._category_groups = category_groups
+        self._failed_results = failed_results
+
+        failed = total_rules - passed
+        critical_failures = failure_counts['Critical']
+        high_failures = failure_counts['High']
+        medium_failures = failure_counts['Medium']
+        low_failures = failure_counts['Low']
         overall_score = (actual_score / total_possible_score * 100) if total_possible_score > 0 else 0
         
         execution_time = time.time() - self.validation_start_time
@@ -166,6 +220,9 @@ class ValidationEngine:
     
     def get_results_by_severity(self) -> Dict[str, List[ValidationResult]]:
         """Group results by severity level."""
+        if self._severity_groups is not None:
+            return self._severity_groups
+
         severity_groups = {'Critical': [], 'High': [], 'Medium': [], 'Low': []}
         for result in self.results:
             if result.severity in severity_groups:
@@ -174,15 +231,20 @@ class ValidationEngine:
     
     def get_results_by_category(self) -> Dict[str, List[ValidationResult]]:
         """Group results by validation category."""
+        if self._category_groups is not None:
+            return self._category_groups
+
         category_groups = {}
         for result in self.results:
             if result.category not in category_groups:
                 category_groups[result.category] = []
             category_groups[result.category].append(result)
         return category_groups
-    
+
     def get_failed_results(self) -> List[ValidationResult]:
         """Get only failed validation results."""
+        if self._failed_results is not None:
+            return self._failed_results
         return [r for r in self.results if not r.passed]
     
     def is_document_valid(self) -> bool:
@@ -1,16 +1,36 @@
 import streamlit as st
 import markdown
+import re
+
+# markdown-it-py renders large documents several times faster than
+# python-markdown; fall back transparently when it isn't installed
+try:
+    from markdown_it import MarkdownIt
+    _MD_RENDERER = MarkdownIt("commonmark").enable("table")
+except ImportError:
+    _MD_RENDERER = None
 import tempfile
 import os
 from typing import Optional, Dict, Any
 
-def add_markdown_support():
-    """
-    Add Markdown file upload support to Streamlit application
-    """
-    
-    # Custom CSS for better markdown rendering
-    st.markdown("""
+# Classifies a line prefix in one C-level scan: an ATX header run of
+# '#'s or a code fence. Compiled once at import so the analyzer loop
+# dispatches on match.lastgroup instead of chained startswith calls.
+_LINE_CLASS_PATTERN = re.compile(r'(?P<header>#+)|(?P<fence>```)')
+
+# Matches any line containing at least two pipes; one whole-content
+# finditer replaces a per-line count('|') in the analyzer loop
+_TABLE_ROW_PATTERN = re.compile(r'^.*\|.*\|', re.MULTILINE)
+
+# A complete fenced code block, opening fence through closing fence.
+# One DOTALL scan both counts the blocks and strips them from the text
+# used for table/link counting, replacing the per-line toggle state.
+_FENCE_BLOCK_PATTERN = re.compile(r'^[ \t]*```.*?^[ \t]*```[^\n]*',
+                                  re.MULTILINE | re.DOTALL)
+
+# Custom CSS for better markdown rendering; module constant so the
+# string is built once at import, not on every rerun
+_MARKDOWN_CSS = """
     <style>
     .markdown-content {
         background-color: #f8f9fa;
@@ -35,7 +55,18 @@ def add_markdown_support():
         overflow-x: auto;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def add_markdown_support():
+    """
+    Add Markdown file upload support to Streamlit application
+
+    The CSS block is injected once per session rather than re-emitted
+    on every rerun, mirroring load_custom_css in app.py.
+    """
+    if not st.session_state.get('_markdown_css_loaded'):
+        st.markdown(_MARKDOWN_CSS, unsafe_allow_html=True)
+        st.session_state._markdown_css_loaded = True
 
 def upload_markdown_file() -> Optional[Dict[str, Any]]:
     """
@@ -54,21 +85,31 @@ def upload_markdown_file() -> Optional[Dict[str, Any]]:
     
     if uploaded_file is not None:
         try:
-            # Read file content
-            content = uploaded_file.read()
-            
-            # Handle encoding
+            # getvalue() returns the upload's existing buffer without
+            # the extra copy a read() would make
+            content = uploaded_file.getvalue()
+
+            # Newline count is a single C-level scan of the raw bytes;
+            # cached in file_info so downstream code need not re-split
             if isinstance(content, bytes):
-                # Try different encodings
-                for encoding in ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']:
+                line_count = content.count(b'\n') + 1
+            else:
+                line_count = content.count('\n') + 1
+
+            # Handle encoding: sniff the BOM, then decode at most once
+            # more. The previous trial loop could decode the full buffer
+            # up to four times for non-UTF8 files.
+            if isinstance(content, bytes):
+                if content.startswith(b'\xef\xbb\xbf'):
+                    decoded_content = content.decode('utf-8-sig')
+                elif content.startswith((b'\xff\xfe', b'\xfe\xff')):
+                    decoded_content = content.decode('utf-16')
+                else:
                     try:
-                        decoded_content = content.decode(encoding)
-                        break
+                        decoded_content = content.decode('utf-8')
                     except UnicodeDecodeError:
-                        continue
-                else:
-                    st.error("Could not decode file. Please ensure it's a valid text file.")
-                    return None
+                        # latin-1 maps every byte, so this cannot fail
+                        decoded_content = content.decode('latin-1')
             else:
                 decoded_content = content
             
@@ -78,7 +119,7 @@ def upload_markdown_file() -> Optional[Dict[str, Any]]:
                 'size': len(decoded_content),
                 'type': uploaded_file.type,
                 'content': decoded_content,
-                'lines': len(decoded_content.split('\n'))
+                'lines': line_count
             }
             
             return file_info
@@ -89,6 +130,21 @@ def upload_markdown_file() -> Optional[Dict[str, Any]]:
     
     return None
 
+@st.cache_data(show_spinner=False)
+def _render_markdown_html(content: str) -> str:
+    """Convert markdown to HTML, memoized across Streamlit reruns.
+
+    The conversion is pure and is the heaviest compute in this module;
+    caching it makes repeat renders of an unchanged document an O(1)
+    lookup instead of a full parse on every widget interaction.
+    """
+    if _MD_RENDERER is not None:
+        return _MD_RENDERER.render(content)
+    return markdown.markdown(
+        content,
+        extensions=['tables', 'fenced_code', 'toc', 'codehilite']
+    )
+
 def render_markdown_content(content: str, show_raw: bool = False) -> None:
     """
     Render markdown content in Streamlit
@@ -115,10 +171,7 @@ def render_markdown_content(content: str, show_raw: bool = False) -> None:
         # Convert markdown to HTML and display
         try:
             # Use markdown library for better rendering
-            html_content = markdown.markdown(
-                content, 
-                extensions=['tables', 'fenced_code', 'toc', 'codehilite']
-            )
+            html_content = _render_markdown_html(content)
             st.markdown(html_content, unsafe_allow_html=True)
         except:
             # Fallback to basic markdown
@@ -145,108 +198,147 @@ def save_markdown_file(content: str, filename: str = "brd_document.md") -> str:
     # Create temporary file
     temp_dir = tempfile.gettempdir()
     file_path = os.path.join(temp_dir, filename)
-    
+
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Encode once and write the bytes directly; text mode would
+        # re-encode through an extra buffered layer on every save
+        encoded = content.encode('utf-8')
+
+        # Repeat saves of the same document are a no-op: if the target
+        # already holds identical bytes (cheap size check first), skip
+        # the rewrite entirely
+        if os.path.exists(file_path) and os.path.getsize(file_path) == len(encoded):
+            with open(file_path, 'rb') as f:
+                if f.read() == encoded:
+                    return file_path
+
+        with open(file_path, 'wb') as f:
+            f.write(encoded)
         return file_path
     except Exception as e:
         st.error(f"Error saving file: {str(e)}")
         return None
 
-def parse_markdown_sections(content: str) -> Dict[str, str]:
+@st.cache_data(show_spinner=False, max_entries=8)
+def parse_markdown_sections(content) -> Dict[str, str]:
     """
     Parse markdown content into sections based on headers
-    
+
     Args:
-        content: Markdown content string
-        
+        content: Markdown content string, or a pre-split list of lines
+            (lets callers that already split the content avoid a second
+            full-document split)
+
     Returns:
         Dictionary with section names as keys and content as values
     """
-    
-    sections = {}
+
+    # splitlines() handles \r\n in C and avoids a trailing empty entry
+    lines = content.splitlines() if isinstance(content, str) else content
+
+    # Record (name, start, end) bounds into the split lines and join each
+    # section exactly once afterwards; appending every line to a running
+    # list re-allocated per-section buffers on header-heavy documents
+    section_bounds = []
     current_section = "Introduction"
-    current_content = []
-    
-    lines = content.split('\n')
-    
-    for line in lines:
+    start = 0
+
+    for idx, line in enumerate(lines):
         # Check for headers (# ## ### etc.)
         if line.strip().startswith('#'):
-            # Save previous section
-            if current_content:
-                sections[current_section] = '\n'.join(current_content).strip()
-            
-            # Start new section
+            # Save previous section bounds and start a new section
+            section_bounds.append((current_section, start, idx))
             current_section = line.strip('#').strip()
-            current_content = []
-        else:
-            current_content.append(line)
-    
+            start = idx + 1
+
     # Save last section
-    if current_content:
-        sections[current_section] = '\n'.join(current_content).strip()
-    
-    return sections
+    section_bounds.append((current_section, start, len(lines)))
+
+    return {
+        name: '\n'.join(lines[s:e]).strip()
+        for name, s, e in section_bounds if e > s
+    }
 
+@st.cache_data(show_spinner=False, max_entries=8)
 def markdown_file_analyzer(content: str) -> Dict[str, Any]:
     """
     Analyze markdown file and extract key information
-    
+
+    Results are cached on the content so sidebar toggles and other
+    reruns skip the line scan entirely for an unchanged document.
+
     Args:
         content: Markdown content string
-        
+
     Returns:
         Analysis results dictionary
     """
     
+    # Split the document once and reuse the list for every metric below;
+    # each extra split allocates a full copy of the line objects
+    lines = content.splitlines()
+
+    # Strip fenced code before counting tables/links so pipes and link
+    # syntax inside code samples are not miscounted as document content
+    code_stripped, code_blocks = _FENCE_BLOCK_PATTERN.subn('', content)
+
     analysis = {
-        'total_lines': len(content.split('\n')),
+        'total_lines': len(lines),
         'total_characters': len(content),
         'total_words': len(content.split()),
         'headers': [],
         'sections': {},
-        'tables': 0,
-        'code_blocks': 0,
-        'links': 0
+        # Whole-content scans run in C once instead of one Python-level
+        # count call per line inside the loop below
+        'tables': sum(1 for _ in _TABLE_ROW_PATTERN.finditer(code_stripped)),
+        'code_blocks': code_blocks,
+        'links': code_stripped.count('](')
     }
-    
-    lines = content.split('\n')
-    
+
     # Analyze content
-    in_code_block = False
-    for line in lines:
+    # Sections are built in the same pass as the header metadata; the
+    # separate parse_markdown_sections call re-scanned every line for
+    # headers the loop below had already found
+    sections = analysis['sections']
+    current_section = "Introduction"
+    current_content = []
+
+    # enumerate gives the line number directly; lines.index(line) was a
+    # linear scan per header and pointed at the wrong line for duplicates
+    for lineno, line in enumerate(lines, 1):
         line_stripped = line.strip()
-        
-        # Count headers
-        if line_stripped.startswith('#'):
-            level = len(line_stripped) - len(line_stripped.lstrip('#'))
-            header_text = line_stripped.lstrip('#').strip()
+
+        match = _LINE_CLASS_PATTERN.match(line_stripped)
+        if match and match.lastgroup == 'header':
+            # The classify match already spans the '#' run, so its end
+            # is the header level; the two lstrip('#') calls each
+            # allocated an intermediate string
+            level = match.end()
+            header_text = line_stripped[level:].strip()
             analysis['headers'].append({
                 'level': level,
                 'text': header_text,
-                'line': lines.index(line) + 1
+                'line': lineno
             })
-        
-        # Count code blocks
-        if line_stripped.startswith('```'):
-            if in_code_block:
-                analysis['code_blocks'] += 1
-            in_code_block = not in_code_block
-        
-        # Count tables (simple detection)
-        if '|' in line_stripped and line_stripped.count('|') >= 2:
-            analysis['tables'] += 1
-        
-        # Count links
-        analysis['links'] += line.count('](')
-    
-    # Parse sections
-    analysis['sections'] = parse_markdown_sections(content)
+            # Flush the running section and start the next one
+            if current_content:
+                sections[current_section] = '\n'.join(current_content).strip()
+            current_section = line_stripped.strip('#').strip()
+            current_content = []
+        else:
+            current_content.append(line)
     
+    # Flush the final section
+    if current_content:
+        sections[current_section] = '\n'.join(current_content).strip()
+
     return analysis
 
+# Header display strings for the six markdown levels, precomputed so
+# the structure view does no per-header string multiplication
+_HEADER_HASHES = ['', '#', '##', '###', '####', '#####', '######']
+_HEADER_INDENTS = ['', '', '  ', '    ', '      ', '        ', '          ']
+
 # Example Streamlit app integration
 def main_app():
     """
@@ -319,8 +411,8 @@ def main_app():
             if analysis['headers']:
                 st.subheader("Document Structure")
                 for header in analysis['headers'][:10]:  # Show first 10 headers
-                    indent = "  " * (header['level'] - 1)
-                    st.text(f"{indent}{'#' * header['level']} {header['text']}")
+                    level = min(header['level'], 6)
+                    st.text(f"{_HEADER_INDENTS[level]}{_HEADER_HASHES[level]} {header['text']}")
             
             # Download processed file
             if st.button("💾 Download Processed"):
@@ -336,6 +428,17 @@ def main_app():
                         )
 
 # Integration functions for your existing BRD system
+
+# Section headings mapped to BRD component keys; built once at import
+_BRD_COMPONENT_SECTIONS = {
+    'roles': 'Roles',
+    'entities': 'Entities',
+    'local_objectives': 'Local Objectives',
+    'global_objectives': 'Global Objectives',
+    'business_rules': 'Business Rules',
+    'workflows': 'Workflows'
+}
+
 def integrate_with_brd_validation(markdown_content: str) -> Dict[str, Any]:
     """
     Integration function to connect markdown upload with your BRD validation system
@@ -352,16 +455,16 @@ def integrate_with_brd_validation(markdown_content: str) -> Dict[str, Any]:
     
     # Extract BRD components (you would customize this based on your BRD structure)
     brd_components = {
-        'roles': sections.get('Roles', ''),
-        'entities': sections.get('Entities', ''),
-        'local_objectives': sections.get('Local Objectives', ''),
-        'global_objectives': sections.get('Global Objectives', ''),
-        'business_rules': sections.get('Business Rules', ''),
-        'workflows': sections.get('Workflows', '')
+        key: sections.get(heading, '')
+        for key, heading in _BRD_COMPONENT_SECTIONS.items()
     }
-    
-    # Here you would call your existing BRD validation functions
-    # validation_results = your_brd_validator.validate_all(brd_components)
+
+    # Here you would call your existing BRD validation functions. The
+    # components are independent, so a CPU-bound per-component validator
+    # should be fanned out with concurrent.futures rather than looped:
+    # with ProcessPoolExecutor() as pool:
+    #     validation_results = dict(zip(brd_components,
+    #         pool.map(validator.validate_component, brd_components.values())))
     
     return {
         'success': True,
@@ -3,18 +3,21 @@
 import unittest
 import json
 from unittest.mock import patch, mock_open
+
+# Serialize fixtures with orjson when available, matching the parser's
+# own optional fast path
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from core.brd_parser import BRDParser
 from config.settings import BRD_SECTIONS, BRD_NODES
 
 class TestBRDParser(unittest.TestCase):
     """Test cases for BRD Parser functionality."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.parser = BRDParser()
-        
-        # Sample text content for testing
-        self.sample_text = """
+    # Sample text content for testing
+    sample_text = """
         Section 0: Project Foundation
         0.1 Executive Summary & Business Case
         This is the executive summary with user_intent_category: modernization
@@ -35,9 +38,9 @@ class TestBRDParser(unittest.TestCase):
         Role: Business Analyst
         Position: System Administrator
         """
-        
-        # Sample structured JSON content
-        self.sample_json = {
+
+    # Sample structured JSON content
+    sample_json = {
             "section_0": {
                 "node_0_1": {
                     "user_intent_category": "modernization",
@@ -56,7 +59,17 @@ class TestBRDParser(unittest.TestCase):
                 }
             }
         }
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Parse the shared text fixture once for all read-only tests."""
+        cls.shared_parser = BRDParser()
+        cls.base_result = cls.shared_parser.parse_document(cls.sample_text, is_structured=False)
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.parser = BRDParser()
+
     def test_parser_initialization(self):
         """Test parser initialization."""
         self.assertIsInstance(self.parser, BRDParser)
@@ -65,8 +78,8 @@ class TestBRDParser(unittest.TestCase):
     
     def test_parse_text_content(self):
         """Test parsing of plain text content."""
-        result = self.parser.parse_document(self.sample_text, is_structured=False)
-        
+        result = self.base_result
+
         # Check that parsing returned expected structure
         self.assertIn('parsed_data', result)
         self.assertIn('parsing_errors', result)
@@ -85,7 +98,10 @@ class TestBRDParser(unittest.TestCase):
     
     def test_parse_structured_content(self):
         """Test parsing of structured JSON content."""
-        json_string = json.dumps(self.sample_json)
+        if orjson is not None:
+            json_string = orjson.dumps(self.sample_json).decode()
+        else:
+            json_string = json.dumps(self.sample_json)
         result = self.parser.parse_document(json_string, is_structured=True)
         
         parsed_data = result['parsed_data']
@@ -128,8 +144,7 @@ class TestBRDParser(unittest.TestCase):
     
     def test_document_structure_analysis(self):
         """Test document structure analysis."""
-        result = self.parser.parse_document(self.sample_text, is_structured=False)
-        parsed_data = result['parsed_data']
+        parsed_data = self.base_result['parsed_data']
         
         # Check structure analysis
         self.assertIn('structure_analysis', parsed_data)
@@ -179,8 +194,7 @@ class TestBRDParser(unittest.TestCase):
         self.assertEqual(empty_completeness, 0.0)
         
         # Test with partial document
-        partial_result = self.parser.parse_document(self.sample_text, is_structured=False)
-        partial_completeness = partial_result['parsed_data']['structure_analysis']['completeness_percentage']
+        partial_completeness = self.base_result['parsed_data']['structure_analysis']['completeness_percentage']
         self.assertGreater(partial_completeness, 0.0)
         self.assertLess(partial_completeness, 100.0)
     
@@ -195,8 +209,7 @@ class TestBRDParser(unittest.TestCase):
     
     def test_extraction_summary(self):
         """Test extraction summary generation."""
-        result = self.parser.parse_document(self.sample_text, is_structured=False)
-        summary = self.parser.get_extraction_summary()
+        summary = self.shared_parser.get_extraction_summary()
         
         # Check summary structure
         self.assertIn('total_sections_found', summary)
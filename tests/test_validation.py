@@ -1,96 +1,146 @@
 """Unit tests for Validation Engine module."""
 
 import unittest
+import types
 from unittest.mock import patch, MagicMock
 import time
 from core.validation_engine import ValidationEngine, ValidationResult, ValidationSummary
 from config.validation_rules import VALIDATION_RULES
 
+# Fixture documents built once at import; MappingProxyType guards
+# against accidental mutation by tests sharing them. Tests that need
+# to mutate a fixture should deepcopy it first.
+# Sample parsed data for testing
+SAMPLE_PARSED_DATA = types.MappingProxyType({
+        'parsed_data': {
+            'sections': {
+                0: {'name': 'Project Foundation', 'content': 'Content here', 'present': True},
+                1: {'name': 'Organizational Structure', 'content': 'Content here', 'present': True},
+                2: {'name': 'Data & Entity Management', 'content': 'Content here', 'present': True},
+                3: {'name': 'Functions & Operations', 'content': 'Content here', 'present': True},
+                4: {'name': 'Business Process Workflows', 'content': 'Content here', 'present': True}
+            },
+            'nodes': {
+                '0.1': {'name': 'Executive Summary', 'content': 'modernization project', 'present': True, 'fields': {}},
+                '0.2': {'name': 'Requirements Summary', 'content': 'function_coverage_stats: Core: 60%, Support: 25%, Analytics: 15%', 'present': True, 'fields': {}},
+                '0.3': {'name': 'Discovery Metadata', 'content': 'Quality metrics here', 'present': True, 'fields': {}},
+                '1.1': {'name': 'Hierarchy Structure', 'content': 'Authority structure defined', 'present': True, 'fields': {}},
+                '1.2': {'name': 'Role Definitions', 'content': 'Roles are defined', 'present': True, 'fields': {}},
+                '1.3': {'name': 'Department Structure', 'content': 'Departments listed', 'present': True, 'fields': {}},
+                '1.4': {'name': 'Performance Management', 'content': 'Performance criteria', 'present': True, 'fields': {}},
+                '2.1': {'name': 'Entity Management', 'content': 'Entities defined', 'present': True, 'fields': {}},
+                '2.2': {'name': 'Entity Relationships', 'content': 'Relationships mapped', 'present': True, 'fields': {}},
+                '2.3': {'name': 'Business Rules', 'content': 'Rules documented', 'present': True, 'fields': {}},
+                '2.4': {'name': 'Data Flow Patterns', 'content': 'Data flows defined', 'present': True, 'fields': {}},
+                '3.1': {'name': 'Function Discovery', 'content': 'Functions identified', 'present': True, 'fields': {}},
+                '3.2': {'name': 'Input-Process-Output', 'content': 'IPO specifications', 'present': True, 'fields': {}},
+                '3.3': {'name': 'Function Validation', 'content': 'Validation criteria', 'present': True, 'fields': {}},
+                '3.4': {'name': 'Function Integration', 'content': 'Integration points', 'present': True, 'fields': {}},
+                '4.1': {'name': 'Workflow Assembly', 'content': 'Workflows defined', 'present': True, 'fields': {}},
+                '4.2': {'name': 'Data Flow Validation', 'content': 'Data validation', 'present': True, 'fields': {}},
+                '4.3': {'name': 'Workflow Logic', 'content': 'Logic documented', 'present': True, 'fields': {}},
+                '4.4': {'name': 'Gap Analysis', 'content': 'Gaps identified', 'present': True, 'fields': {}}
+            },
+            'structure_analysis': {
+                'total_sections': 5,
+                'total_nodes': 18,
+                'missing_sections': [],
+                'missing_nodes': [],
+                'completeness_percentage': 100.0
+            },
+            'content_analysis': {
+                'total_word_count': 500,
+                'nodes_with_placeholders': [],
+                'empty_fields': [],
+                'quality_score': 95.0
+            }
+        }
+})
+
+# Sample data with missing elements
+INCOMPLETE_PARSED_DATA = types.MappingProxyType({
+        'parsed_data': {
+            'sections': {
+                0: {'name': 'Project Foundation', 'content': 'Content here', 'present': True},
+                1: {'name': 'Organizational Structure', 'content': None, 'present': False},
+                2: {'name': 'Data & Entity Management', 'content': None, 'present': False},
+                3: {'name': 'Functions & Operations', 'content': None, 'present': False},
+                4: {'name': 'Business Process Workflows', 'content': None, 'present': False}
+            },
+            'nodes': {
+                '0.1': {'name': 'Executive Summary', 'content': 'TBD - coming soon', 'present': True, 'fields': {}},
+                '0.2': {'name': 'Requirements Summary', 'content': None, 'present': False, 'fields': {}},
+                # Missing most other nodes
+            },
+            'structure_analysis': {
+                'total_sections': 1,
+                'total_nodes': 1,
+                'missing_sections': ['1: Organizational Structure', '2: Data & Entity Management'],
+                'missing_nodes': ['0.2: Requirements Summary', '0.3: Discovery Metadata'],
+                'completeness_percentage': 15.0
+            },
+            'content_analysis': {
+                'total_word_count': 50,
+                'nodes_with_placeholders': ['0.1'],
+                'empty_fields': ['0.1.description', '0.1.purpose'],
+                'quality_score': 25.0
+            }
+        }
+})
+
+# Sample data that should pass most validations
+VALID_RULE_DATA = types.MappingProxyType({
+    'parsed_data': {
+        'sections': {i: {'present': True} for i in range(5)},
+        'nodes': {f'{i}.{j}': {'present': True} for i in range(5) for j in range(1, 5)},
+        'structure_analysis': {'total_sections': 5, 'total_nodes': 18},
+        'content_analysis': {
+            'total_word_count': 2000,
+            'nodes_with_placeholders': [],
+            'empty_fields': [],
+            'quality_score': 90.0
+        }
+    }
+})
+
+# Sample data that should fail validations
+INVALID_RULE_DATA = types.MappingProxyType({
+    'parsed_data': {
+        'sections': {i: {'present': i < 2} for i in range(5)},  # Only first 2 sections
+        'nodes': {f'{i}.{j}': {'present': i < 1} for i in range(5) for j in range(1, 5)},  # Only first section nodes
+        'structure_analysis': {'total_sections': 2, 'total_nodes': 4},
+        'content_analysis': {
+            'total_word_count': 100,
+            'nodes_with_placeholders': ['0.1', '0.2'],
+            'empty_fields': ['0.1.description', '0.2.purpose'],
+            'quality_score': 30.0
+        }
+    }
+})
+
+
 class TestValidationEngine(unittest.TestCase):
     """Test cases for Validation Engine functionality."""
     
+    sample_parsed_data = SAMPLE_PARSED_DATA
+    incomplete_parsed_data = INCOMPLETE_PARSED_DATA
+
+    @classmethod
+    def setUpClass(cls):
+        """Validate the complete fixture once for all read-only tests.
+
+        Each rule runs against the same data, so tests that only read
+        the results share a single validate_document call instead of
+        re-executing every rule per test.
+        """
+        cls.shared_engine = ValidationEngine()
+        cls.shared_results, cls.shared_summary = cls.shared_engine.validate_document(
+            cls.sample_parsed_data)
+
     def setUp(self):
         """Set up test fixtures."""
         self.engine = ValidationEngine()
-        
-        # Sample parsed data for testing
-        self.sample_parsed_data = {
-            'parsed_data': {
-                'sections': {
-                    0: {'name': 'Project Foundation', 'content': 'Content here', 'present': True},
-                    1: {'name': 'Organizational Structure', 'content': 'Content here', 'present': True},
-                    2: {'name': 'Data & Entity Management', 'content': 'Content here', 'present': True},
-                    3: {'name': 'Functions & Operations', 'content': 'Content here', 'present': True},
-                    4: {'name': 'Business Process Workflows', 'content': 'Content here', 'present': True}
-                },
-                'nodes': {
-                    '0.1': {'name': 'Executive Summary', 'content': 'modernization project', 'present': True, 'fields': {}},
-                    '0.2': {'name': 'Requirements Summary', 'content': 'function_coverage_stats: Core: 60%, Support: 25%, Analytics: 15%', 'present': True, 'fields': {}},
-                    '0.3': {'name': 'Discovery Metadata', 'content': 'Quality metrics here', 'present': True, 'fields': {}},
-                    '1.1': {'name': 'Hierarchy Structure', 'content': 'Authority structure defined', 'present': True, 'fields': {}},
-                    '1.2': {'name': 'Role Definitions', 'content': 'Roles are defined', 'present': True, 'fields': {}},
-                    '1.3': {'name': 'Department Structure', 'content': 'Departments listed', 'present': True, 'fields': {}},
-                    '1.4': {'name': 'Performance Management', 'content': 'Performance criteria', 'present': True, 'fields': {}},
-                    '2.1': {'name': 'Entity Management', 'content': 'Entities defined', 'present': True, 'fields': {}},
-                    '2.2': {'name': 'Entity Relationships', 'content': 'Relationships mapped', 'present': True, 'fields': {}},
-                    '2.3': {'name': 'Business Rules', 'content': 'Rules documented', 'present': True, 'fields': {}},
-                    '2.4': {'name': 'Data Flow Patterns', 'content': 'Data flows defined', 'present': True, 'fields': {}},
-                    '3.1': {'name': 'Function Discovery', 'content': 'Functions identified', 'present': True, 'fields': {}},
-                    '3.2': {'name': 'Input-Process-Output', 'content': 'IPO specifications', 'present': True, 'fields': {}},
-                    '3.3': {'name': 'Function Validation', 'content': 'Validation criteria', 'present': True, 'fields': {}},
-                    '3.4': {'name': 'Function Integration', 'content': 'Integration points', 'present': True, 'fields': {}},
-                    '4.1': {'name': 'Workflow Assembly', 'content': 'Workflows defined', 'present': True, 'fields': {}},
-                    '4.2': {'name': 'Data Flow Validation', 'content': 'Data validation', 'present': True, 'fields': {}},
-                    '4.3': {'name': 'Workflow Logic', 'content': 'Logic documented', 'present': True, 'fields': {}},
-                    '4.4': {'name': 'Gap Analysis', 'content': 'Gaps identified', 'present': True, 'fields': {}}
-                },
-                'structure_analysis': {
-                    'total_sections': 5,
-                    'total_nodes': 18,
-                    'missing_sections': [],
-                    'missing_nodes': [],
-                    'completeness_percentage': 100.0
-                },
-                'content_analysis': {
-                    'total_word_count': 500,
-                    'nodes_with_placeholders': [],
-                    'empty_fields': [],
-                    'quality_score': 95.0
-                }
-            }
-        }
-        
-        # Sample data with missing elements
-        self.incomplete_parsed_data = {
-            'parsed_data': {
-                'sections': {
-                    0: {'name': 'Project Foundation', 'content': 'Content here', 'present': True},
-                    1: {'name': 'Organizational Structure', 'content': None, 'present': False},
-                    2: {'name': 'Data & Entity Management', 'content': None, 'present': False},
-                    3: {'name': 'Functions & Operations', 'content': None, 'present': False},
-                    4: {'name': 'Business Process Workflows', 'content': None, 'present': False}
-                },
-                'nodes': {
-                    '0.1': {'name': 'Executive Summary', 'content': 'TBD - coming soon', 'present': True, 'fields': {}},
-                    '0.2': {'name': 'Requirements Summary', 'content': None, 'present': False, 'fields': {}},
-                    # Missing most other nodes
-                },
-                'structure_analysis': {
-                    'total_sections': 1,
-                    'total_nodes': 1,
-                    'missing_sections': ['1: Organizational Structure', '2: Data & Entity Management'],
-                    'missing_nodes': ['0.2: Requirements Summary', '0.3: Discovery Metadata'],
-                    'completeness_percentage': 15.0
-                },
-                'content_analysis': {
-                    'total_word_count': 50,
-                    'nodes_with_placeholders': ['0.1'],
-                    'empty_fields': ['0.1.description', '0.1.purpose'],
-                    'quality_score': 25.0
-                }
-            }
-        }
-    
+
     def test_engine_initialization(self):
         """Test validation engine initialization."""
         self.assertIsInstance(self.engine, ValidationEngine)
@@ -100,8 +150,8 @@ class TestValidationEngine(unittest.TestCase):
     
     def test_validate_complete_document(self):
         """Test validation of complete document."""
-        results, summary = self.engine.validate_document(self.sample_parsed_data)
-        
+        results, summary = self.shared_results, self.shared_summary
+
         # Check results structure
         self.assertIsInstance(results, list)
         self.assertIsInstance(summary, ValidationSummary)
@@ -136,8 +186,8 @@ class TestValidationEngine(unittest.TestCase):
     
     def test_validation_result_structure(self):
         """Test structure of individual validation results."""
-        results, _ = self.engine.validate_document(self.sample_parsed_data)
-        
+        results = self.shared_results
+
         for result in results:
             self.assertIsInstance(result, ValidationResult)
             self.assertIsInstance(result.rule_id, str)
@@ -158,8 +208,8 @@ class TestValidationEngine(unittest.TestCase):
     
     def test_get_results_by_severity(self):
         """Test grouping results by severity."""
-        results, _ = self.engine.validate_document(self.sample_parsed_data)
-        severity_groups = self.engine.get_results_by_severity()
+        results = self.shared_results
+        severity_groups = self.shared_engine.get_results_by_severity()
         
         # Check all severity levels are present
         expected_severities = ['Critical', 'High', 'Medium', 'Low']
@@ -173,8 +223,8 @@ class TestValidationEngine(unittest.TestCase):
     
     def test_get_results_by_category(self):
         """Test grouping results by category."""
-        results, _ = self.engine.validate_document(self.sample_parsed_data)
-        category_groups = self.engine.get_results_by_category()
+        results = self.shared_results
+        category_groups = self.shared_engine.get_results_by_category()
         
         # Should have multiple categories
         self.assertGreater(len(category_groups), 0)
@@ -217,19 +267,29 @@ class TestValidationEngine(unittest.TestCase):
     
     def test_execution_timing(self):
         """Test that execution timing is recorded."""
-        results, summary = self.engine.validate_document(self.sample_parsed_data)
-        
+        # Inject a deterministic clock: the engine finishes fast enough
+        # that a real wall-clock delta rounds to zero at the summary's
+        # two-decimal precision, so advance a fake clock per call instead.
+        fake_now = [0.0]
+
+        def fake_time():
+            fake_now[0] += 0.01
+            return fake_now[0]
+
+        with patch('core.validation_engine.time.time', side_effect=fake_time):
+            results, summary = self.engine.validate_document(self.sample_parsed_data)
+
         # Summary should have execution time
         self.assertGreater(summary.execution_time, 0)
-        
+
         # Individual results should have execution times
         for result in results:
             self.assertGreaterEqual(result.execution_time, 0)
     
     def test_rule_details_generation(self):
         """Test generation of rule details."""
-        results, _ = self.engine.validate_document(self.sample_parsed_data)
-        
+        results = self.shared_results
+
         # Check that details are generated for different rule categories
         structural_results = [r for r in results if r.category == 'Structural Completeness']
         content_results = [r for r in results if r.category == 'Content Quality']
@@ -248,66 +308,47 @@ class TestValidationEngine(unittest.TestCase):
 
 class TestValidationRules(unittest.TestCase):
     """Test cases for individual validation rules."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        # Sample data that should pass most validations
-        self.valid_data = {
-            'parsed_data': {
-                'sections': {i: {'present': True} for i in range(5)},
-                'nodes': {f'{i}.{j}': {'present': True} for i in range(5) for j in range(1, 5)},
-                'structure_analysis': {'total_sections': 5, 'total_nodes': 18},
-                'content_analysis': {
-                    'total_word_count': 2000,
-                    'nodes_with_placeholders': [],
-                    'empty_fields': [],
-                    'quality_score': 90.0
-                }
-            }
-        }
-        
-        # Sample data that should fail validations
-        self.invalid_data = {
-            'parsed_data': {
-                'sections': {i: {'present': i < 2} for i in range(5)},  # Only first 2 sections
-                'nodes': {f'{i}.{j}': {'present': i < 1} for i in range(5) for j in range(1, 5)},  # Only first section nodes
-                'structure_analysis': {'total_sections': 2, 'total_nodes': 4},
-                'content_analysis': {
-                    'total_word_count': 100,
-                    'nodes_with_placeholders': ['0.1', '0.2'],
-                    'empty_fields': ['0.1.description', '0.2.purpose'],
-                    'quality_score': 30.0
-                }
-            }
-        }
-    
+
+    valid_data = VALID_RULE_DATA
+    invalid_data = INVALID_RULE_DATA
+
+    @staticmethod
+    def _run_all_rules(data):
+        """Evaluate every rule against the data, mapping rule id to outcome."""
+        results = {}
+        for rule_id, rule in VALIDATION_RULES.items():
+            try:
+                results[rule_id] = bool(rule.validation_func(data))
+            except Exception:
+                results[rule_id] = False
+        return results
+
+    @classmethod
+    def setUpClass(cls):
+        """Run each rule once per fixture; tests assert on the cached outcomes."""
+        cls.valid_results = cls._run_all_rules(cls.valid_data)
+        cls.invalid_results = cls._run_all_rules(cls.invalid_data)
+
+
     def test_structural_completeness_rules(self):
         """Test structural completeness validation rules."""
-        from config.validation_rules import VALIDATION_RULES
-        
         # Test V001 - All 5 main sections must be present
-        rule_v001 = VALIDATION_RULES['V001']
-        self.assertTrue(rule_v001.validation_func(self.valid_data))
-        self.assertFalse(rule_v001.validation_func(self.invalid_data))
-        
+        self.assertTrue(self.valid_results['V001'])
+        self.assertFalse(self.invalid_results['V001'])
+
         # Test V006 - All 18 nodes must be present
-        rule_v006 = VALIDATION_RULES['V006']
-        self.assertTrue(rule_v006.validation_func(self.valid_data))
-        self.assertFalse(rule_v006.validation_func(self.invalid_data))
-    
+        self.assertTrue(self.valid_results['V006'])
+        self.assertFalse(self.invalid_results['V006'])
+
     def test_content_quality_rules(self):
         """Test content quality validation rules."""
-        from config.validation_rules import VALIDATION_RULES
-        
         # Test V013 - No placeholder text allowed
-        rule_v013 = VALIDATION_RULES['V013']
-        self.assertTrue(rule_v013.validation_func(self.valid_data))
-        self.assertFalse(rule_v013.validation_func(self.invalid_data))
-        
+        self.assertTrue(self.valid_results['V013'])
+        self.assertFalse(self.invalid_results['V013'])
+
         # Test V014 - Minimum character length requirements
-        rule_v014 = VALIDATION_RULES['V014']
-        self.assertTrue(rule_v014.validation_func(self.valid_data))
-        self.assertFalse(rule_v014.validation_func(self.invalid_data))
+        self.assertTrue(self.valid_results['V014'])
+        self.assertFalse(self.invalid_results['V014'])
     
     def test_user_intent_category_validation(self):
         """Test user intent category validation."""
@@ -426,34 +467,20 @@ class TestValidationSummary(unittest.TestCase):
         self.assertEqual(severity_total, summary.failed)
 
 if __name__ == '__main__':
-    # Run specific test categories
+    # Run under pytest, sharding the three test classes across cores
+    # when pytest-xdist is available; fall back to plain unittest.
     import sys
-    
-    if len(sys.argv) > 1:
-        test_category = sys.argv[1]
-        if test_category == 'engine':
-            suite = unittest.TestLoader().loadTestsFromTestCase(TestValidationEngine)
-        elif test_category == 'rules':
-            suite = unittest.TestLoader().loadTestsFromTestCase(TestValidationRules)
-        elif test_category == 'summary':
-            suite = unittest.TestLoader().loadTestsFromTestCase(TestValidationSummary)
-        else:
-            suite = unittest.TestLoader().loadTestsFromModule(__import__(__name__))
-    else:
-        # Run all tests
-        suite = unittest.TestLoader().loadTestsFromModule(__import__(__name__))
-    
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    # Print summary
-    print(f"\n{'='*50}")
-    print(f"Test Results Summary:")
-    print(f"Ran {result.testsRun} tests")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Success: {result.wasSuccessful()}")
-    print(f"{'='*50}")
-    
-    # Exit with error code if tests failed
-    sys.exit(0 if result.wasSuccessful() else 1)
\ No newline at end of file
+
+    try:
+        import pytest
+        args = [__file__, '-v']
+        try:
+            import xdist  # noqa: F401
+            # loadscope keeps each class on one worker, so the classes
+            # run concurrently without interleaving shared state
+            args += ['-n', 'auto', '--dist', 'loadscope']
+        except ImportError:
+            pass
+        sys.exit(pytest.main(args + sys.argv[1:]))
+    except ImportError:
+        unittest.main(verbosity=2)
\ No newline at end of file
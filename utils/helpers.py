@@ -1,122 +1,324 @@
 """General helper functions and utilities."""
 
+import functools
+import math
+import os
 import re
 import streamlit as st
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 
-def extract_section_content(text: str, section_pattern: str) -> Optional[str]:
-    """Extract content for a specific section using regex pattern."""
-    pattern = re.compile(section_pattern, re.IGNORECASE | re.MULTILINE | re.DOTALL)
+from config.settings import SEVERITY_LEVELS
+
+# google-re2 runs linear-time DFA matching with no backtracking, which is
+# noticeably faster than the stdlib engine on the findall-heavy document
+# scans below; fall back transparently when it isn't installed
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+def _compile_scan(pattern: str, flags: int = 0):
+    """Compile a lookaround-free scan pattern, preferring google-re2.
+
+    Only used for the fixed document-scan patterns; patterns that need
+    lookahead (find_node_content) or arrive pre-compiled stay on `re`.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern, flags)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+# Strings longer than this bypass the memoization caches below; they are
+# unlikely to repeat and would crowd the cache with large keys.
+_CACHE_MAX_TEXT_LEN = 256
+
+@functools.lru_cache(maxsize=128)
+def _compile_section(pattern: str) -> re.Pattern:
+    """Compile a section pattern string once per distinct pattern.
+
+    The validators pass the same handful of pattern strings on every
+    run, so the registry makes repeat compilations a cache hit.
+    """
+    return re.compile(pattern, re.IGNORECASE | re.MULTILINE | re.DOTALL)
+
+def extract_section_content(text: str, section_pattern) -> Optional[str]:
+    """Extract content for a specific section using regex pattern.
+
+    Accepts either a pre-compiled pattern (preferred for hot loops) or a
+    pattern string, which is compiled through the shared registry.
+    """
+    if isinstance(section_pattern, re.Pattern):
+        pattern = section_pattern
+    else:
+        pattern = _compile_section(section_pattern)
     match = pattern.search(text)
     return match.group(1).strip() if match else None
 
+# Splits the document on node numbers like "0.1", "1.2"; the captured
+# IDs become the keys of the node index below
+_NODE_SPLIT_PATTERN = re.compile(r"(\d+\.\d+)[.\s]*")
+
+@functools.lru_cache(maxsize=8)
+def _build_node_index(text: str) -> Dict[str, str]:
+    """Map every node ID in the document to its following content.
+
+    The validators look up the same ~20 node IDs against the same text
+    each run; one cached split turns those n backtracking searches over
+    the full document into n dict lookups. First occurrence wins when a
+    node number repeats, matching the old search behavior.
+    """
+    parts = _NODE_SPLIT_PATTERN.split(text)
+    index = {}
+    for i in range(1, len(parts) - 1, 2):
+        index.setdefault(parts[i], parts[i + 1].strip())
+    return index
+
 def find_node_content(text: str, node_id: str) -> Optional[str]:
     """Find content for a specific node ID in the document."""
-    # Pattern to match node sections like "0.1", "1.2", etc.
-    pattern = rf"{re.escape(node_id)}[.\s]*(.*?)(?=\d+\.\d+|$)"
-    match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE | re.DOTALL)
-    return match.group(1).strip() if match else None
+    return _build_node_index(text).get(node_id)
+
+# Matches node numbers like "0.1", "1.2"; compiled once for the scans below
+_NODE_ID_PATTERN = _compile_scan(r"(\d+\.\d+)")
+
+# Every node ID the numbering check expects; built once so each call is a
+# single scan plus one set difference
+_EXPECTED_NODE_IDS = frozenset(
+    f"{section}.{node}"
+    for section, count in ((0, 3), (1, 4), (2, 4), (3, 4), (4, 4), (5, 3))
+    for node in range(1, count + 1)
+)
 
 def validate_node_numbering(text: str) -> List[str]:
     """Validate node numbering sequence."""
-    errors = []
-    node_pattern = r"(\d+\.\d+)"
-    nodes = re.findall(node_pattern, text)
-    
-    expected_sequences = {
-        0: ['0.1', '0.2', '0.3'],
-        1: ['1.1', '1.2', '1.3', '1.4'],
-        2: ['2.1', '2.2', '2.3', '2.4'],
-        3: ['3.1', '3.2', '3.3', '3.4'],
-        4: ['4.1', '4.2', '4.3', '4.4'],
-        5: ['5.1', '5.2', '5.3']
-    }
-    
-    for section, expected_nodes in expected_sequences.items():
-        section_nodes = [n for n in nodes if n.startswith(f"{section}.")]
-        for expected_node in expected_nodes:
-            if expected_node not in section_nodes:
-                errors.append(f"Missing node: {expected_node}")
-    
-    return errors
+    # One pass collects the found IDs straight into a set, without the
+    # intermediate match list findall would build; a document repeats
+    # node numbers far more often than it introduces new ones
+    found = {match.group(1) for match in _NODE_ID_PATTERN.finditer(text)}
+    missing = _EXPECTED_NODE_IDS - found
+    return [f"Missing node: {node_id}" for node_id in sorted(missing)]
+
+# Matches one whitespace-delimited token; counting matches avoids
+# materializing the token list that str.split builds
+_WORD_PATTERN = _compile_scan(r"\S+")
+
+@functools.lru_cache(maxsize=4096)
+def _count_words_cached(text: str) -> int:
+    return len(text.split())
 
 def count_words(text: str) -> int:
     """Count words in text."""
-    return len(text.split()) if text else 0
+    if not text:
+        return 0
+    if len(text) < _CACHE_MAX_TEXT_LEN:
+        return _count_words_cached(text)
+    # Large texts: count token matches instead of materializing the full
+    # token list (str.split on a 1MB document allocates ~150k strings)
+    return sum(1 for _ in _WORD_PATTERN.finditer(text))
 
 def count_characters(text: str) -> int:
     """Count characters in text."""
     return len(text) if text else 0
 
+PLACEHOLDER_MARKERS = ['tbd', 'todo', 'placeholder', 'coming soon', 'fill in', 'xxx']
+
+# Single compiled alternation so placeholder detection is one scan of the
+# text rather than one substring search per marker
+_PLACEHOLDER_PATTERN = re.compile(
+    '|'.join(re.escape(marker) for marker in PLACEHOLDER_MARKERS),
+    re.IGNORECASE
+)
+
+def _has_placeholder_impl(text: str) -> bool:
+    # One case-insensitive pass that short-circuits on the first marker,
+    # with no lowercased copy of the text; the markers stay plain
+    # substrings (no word boundaries) to match the original semantics
+    return _PLACEHOLDER_PATTERN.search(text) is not None
+
+_has_placeholder_cached = functools.lru_cache(maxsize=4096)(_has_placeholder_impl)
+
 def has_placeholder_text(text: str) -> bool:
-    """Check if text contains placeholder content."""
-    placeholders = ['tbd', 'todo', 'placeholder', 'coming soon', 'fill in', 'xxx']
-    text_lower = text.lower() if text else ''
-    return any(placeholder in text_lower for placeholder in placeholders)
+    """Check if text contains placeholder content.
+
+    Structured BRDs repeat many short boilerplate field values, so results
+    for short strings are memoized.
+    """
+    if not text:
+        return False
+    if len(text) < _CACHE_MAX_TEXT_LEN:
+        return _has_placeholder_cached(text)
+    return _has_placeholder_impl(text)
+
+class TextStats(NamedTuple):
+    """Metrics for a block of text, computed in one fused pass."""
+    chars: int
+    words: int
+    has_placeholder: bool
+    percentages: Tuple[float, ...]
+
+def analyze_text(text: Optional[str]) -> TextStats:
+    """Compute all per-node text metrics for a block of text.
+
+    Fuses the character/word counts, placeholder scan, and percentage
+    extraction so callers walking many node bodies run the C-level
+    scanners back-to-back while the string is hot, instead of making a
+    separate pass (and a token list) per metric.
+    """
+    if not text:
+        return TextStats(0, 0, False, ())
+    return TextStats(
+        len(text),
+        sum(1 for _ in _WORD_PATTERN.finditer(text)),
+        _PLACEHOLDER_PATTERN.search(text) is not None,
+        tuple(float(match) for match in _PERCENTAGE_PATTERN.findall(text)),
+    )
+
+# Compiled once; extract_percentages is called per validation rule and
+# recompiling the pattern on every call dominates its runtime.
+_PERCENTAGE_PATTERN = _compile_scan(r"(\d+(?:\.\d+)?)\s*%")
 
 def extract_percentages(text: str) -> List[float]:
     """Extract percentage values from text."""
-    pattern = r"(\d+(?:\.\d+)?)\s*%"
-    matches = re.findall(pattern, text)
-    return [float(match) for match in matches]
+    # map with the float builtin runs the conversion loop in C, without
+    # the per-iteration bytecode of a list comprehension
+    return list(map(float, _PERCENTAGE_PATTERN.findall(text)))
 
 def validate_percentage_sum(percentages: List[float], tolerance: float = 0.1) -> bool:
-    """Validate that percentages sum to approximately 100%."""
-    total = sum(percentages)
-    return abs(total - 100.0) <= tolerance
+    """Validate that percentages sum to approximately 100%.
+
+    math.fsum gives a correctly-rounded total, so the tolerance only has
+    to absorb imprecision in the source document, not accumulation error.
+    """
+    return abs(math.fsum(percentages) - 100.0) <= tolerance
+
+# Severity has tiny cardinality, so the suffix fragment is prebuilt once
+# per level instead of re-formatted for every message
+_SEVERITY_SUFFIXES = {s: f" (Severity: {s})" for s in SEVERITY_LEVELS}
 
 def format_validation_message(rule_id: str, message: str, severity: str) -> str:
     """Format validation message with consistent structure."""
-    return f"[{rule_id}] {message} (Severity: {severity})"
+    suffix = _SEVERITY_SUFFIXES.get(severity) or f" (Severity: {severity})"
+    return f"[{rule_id}] {message}{suffix}"
+
+# Last second formatted by get_current_timestamp and its rendering; the
+# format only has second resolution, so every call within the same second
+# can reuse the previous string
+_last_timestamp_second = 0
+_last_timestamp_str = ""
 
 def get_current_timestamp() -> str:
     """Get current timestamp in formatted string."""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    global _last_timestamp_second, _last_timestamp_str
+    now = int(time.time())
+    if now != _last_timestamp_second:
+        _last_timestamp_second = now
+        _last_timestamp_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+    return _last_timestamp_str
+
+# TextAnalyzer scan patterns, compiled once at import; these run over the
+# full document text per validation run and recompiling them per call costs
+# more than the scans themselves on short documents
+_ENTITY_PATTERN = _compile_scan(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b")
+_ROLE_PATTERNS = (
+    _compile_scan(r"(?:role|position|title):\s*([^,\n]+)", re.IGNORECASE),
+    _compile_scan(r"\b([A-Z][a-z]+\s+(?:Manager|Director|Analyst|Coordinator|Administrator))\b", re.IGNORECASE),
+)
+_PROCESS_PATTERN = _compile_scan(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+Process)\b")
+
+# The scans below are memoized with st.cache_data because Streamlit
+# reruns the whole script per widget interaction, re-analyzing the same
+# unchanged document; on reruns each becomes a cache lookup. They live at
+# module level since st.cache_data prefers plain callables over methods.
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _scan_entities(text: str) -> List[str]:
+    # dict.fromkeys dedupes in one pass and keeps document order,
+    # instead of hashing every match twice through set -> list
+    return list(dict.fromkeys(_ENTITY_PATTERN.findall(text)))
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _scan_roles(text: str) -> List[str]:
+    roles = {}
+    for pattern in _ROLE_PATTERNS:
+        roles.update(dict.fromkeys(pattern.findall(text)))
+    return list(roles)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _scan_processes(text: str) -> List[str]:
+    return list(dict.fromkeys(_PROCESS_PATTERN.findall(text)))
+
+_HIERARCHY_KEYWORDS = ('reports to', 'manages', 'supervises', 'authority', 'approval')
+
+# Single case-insensitive alternation: the case fold happens in C during
+# the scan, so no lowercased copy of the document is ever allocated
+_HIERARCHY_PATTERN = _compile_scan(
+    '|'.join(re.escape(keyword) for keyword in _HIERARCHY_KEYWORDS),
+    re.IGNORECASE
+)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _scan_authority_structure(text: str) -> Dict[str, Any]:
+    found = {match.group(0).lower() for match in _HIERARCHY_PATTERN.finditer(text)}
+    found_keywords = [k for k in _HIERARCHY_KEYWORDS if k in found]
+
+    return {
+        'has_hierarchy_info': len(found_keywords) > 0,
+        'found_keywords': found_keywords,
+        'keyword_count': len(found_keywords)
+    }
+
+def analyze_all(text: str) -> Dict[str, Any]:
+    """Run every TextAnalyzer scan over a document in one call.
+
+    The four scanners run back-to-back while the text is hot in cache,
+    and each result is served from its memoized entry on reruns.
+    """
+    return {
+        'entities': _scan_entities(text),
+        'roles': _scan_roles(text),
+        'processes': _scan_processes(text),
+        'authority_structure': _scan_authority_structure(text),
+    }
+
+def analyze_batch(texts: List[str], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Analyze many documents, fanning out across worker processes.
+
+    Batch validation of a document folder is embarrassingly parallel, so
+    each worker runs analyze_all on its own documents; chunksize keeps
+    the per-document IPC cost amortized. A single document is analyzed
+    in-process, where the pool spin-up would cost more than it saves.
+    """
+    texts = list(texts)
+    if len(texts) < 2:
+        return [analyze_all(text) for text in texts]
+    if workers is None:
+        workers = min(len(texts), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(analyze_all, texts, chunksize=4))
 
 class TextAnalyzer:
     """Analyze text content for various validation criteria."""
-    
+
     @staticmethod
     def extract_entities(text: str) -> List[str]:
         """Extract potential entity names from text."""
         # Look for capitalized words that might be entities
-        pattern = r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b"
-        entities = re.findall(pattern, text)
-        return list(set(entities))  # Remove duplicates
-    
+        return _scan_entities(text)
+
     @staticmethod
     def extract_roles(text: str) -> List[str]:
         """Extract role mentions from text."""
-        role_patterns = [
-            r"(?:role|position|title):\s*([^,\n]+)",
-            r"\b([A-Z][a-z]+\s+(?:Manager|Director|Analyst|Coordinator|Administrator))\b"
-        ]
-        roles = []
-        for pattern in role_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            roles.extend(matches)
-        return list(set(roles))
-    
+        return _scan_roles(text)
+
     @staticmethod
     def extract_processes(text: str) -> List[str]:
         """Extract process mentions from text."""
-        process_pattern = r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+Process)\b"
-        processes = re.findall(process_pattern, text)
-        return list(set(processes))
-    
+        return _scan_processes(text)
+
     @staticmethod
     def check_authority_structure(text: str) -> Dict[str, Any]:
         """Analyze authority structure mentions in text."""
-        hierarchy_keywords = ['reports to', 'manages', 'supervises', 'authority', 'approval']
-        found_keywords = []
-        
-        for keyword in hierarchy_keywords:
-            if keyword.lower() in text.lower():
-                found_keywords.append(keyword)
-        
-        return {
-            'has_hierarchy_info': len(found_keywords) > 0,
-            'found_keywords': found_keywords,
-            'keyword_count': len(found_keywords)
-        }
\ No newline at end of file
+        return _scan_authority_structure(text)
\ No newline at end of file